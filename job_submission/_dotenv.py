@@ -0,0 +1,38 @@
+"""Shared .env loader.
+
+Parsing is memoized on (path, mtime), so the CLIs and the worker
+importing each other in one process parse the file exactly once.
+"""
+from __future__ import annotations
+
+import functools
+import os
+from pathlib import Path
+
+_DEFAULT_PATH = Path(__file__).parent.parent / ".env"
+
+@functools.lru_cache(maxsize=None)
+def _parse(path_str: str, mtime: float) -> tuple[tuple[str, str], ...]:
+    pairs: list[tuple[str, str]] = []
+    for raw in Path(path_str).read_text().splitlines():
+        raw = raw.strip()
+        if not raw or raw.startswith("#"):
+            continue
+        if raw[:7].lower() == "export ":
+            raw = raw[7:].lstrip()
+        k, sep, v = raw.partition("=")
+        if sep:
+            pairs.append((k.strip(), v.strip()))
+    return tuple(pairs)
+
+def load_dotenv(path: Path = _DEFAULT_PATH) -> None:
+    """Populate os.environ from *path*.
+
+    An existing real environment variable always wins.
+    """
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return
+    for k, v in _parse(str(path), mtime):
+        os.environ.setdefault(k, v)
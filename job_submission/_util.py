@@ -0,0 +1,61 @@
+"""Helpers shared by the submit/get CLIs and the worker stores."""
+from __future__ import annotations
+
+import shutil
+import threading
+
+# Building a boto3 Session plus resource/client costs tens of ms each
+# (botocore generates clients from JSON service models at runtime), so
+# cache them per endpoint and hand every caller the same instances.
+_boto_cache_lock = threading.Lock()
+_session_cache: dict = {}
+_conn_cache: dict = {}
+
+def cached_s3_conn(endpoint_url, region_name):
+    """Return a cached (resource, client) pair for the given endpoint."""
+    import boto3
+    from botocore.client import Config as _BotoConfig
+
+    key = (endpoint_url, region_name)
+    with _boto_cache_lock:
+        conn = _conn_cache.get(key)
+        if conn is None:
+            cfg = _BotoConfig(
+                s3={"addressing_style": "path"},
+                retries={"max_attempts": 10, "mode": "standard"},
+                max_pool_connections=64,
+                tcp_keepalive=True,
+            )
+            session = _session_cache.setdefault(key, boto3.session.Session())
+            conn = (
+                session.resource(
+                    "s3", endpoint_url=endpoint_url, region_name=region_name, config=cfg
+                ),
+                session.client(
+                    "s3", endpoint_url=endpoint_url, region_name=region_name, config=cfg
+                ),
+            )
+            _conn_cache[key] = conn
+        return conn
+
+def normalize_prefix(prefix: str) -> str:
+    """Return *prefix* with a trailing "/".
+
+    Always list with the terminating delimiter: some S3 implementations
+    scan far more shards for a bare key prefix, making "uuid" listings
+    orders of magnitude slower than "uuid/".
+    """
+    return prefix if prefix.endswith("/") else f"{prefix}/"
+
+_FICLONE = 0x40049409  # Linux FICLONE ioctl: clone extents instead of copying
+
+def reflink_or_copy(src, dst) -> None:
+    """Reflink *src* to *dst* on filesystems that support it (btrfs/xfs),
+    falling back to a regular copy. A reflink is O(1) regardless of size."""
+    try:
+        import fcntl
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        shutil.copystat(src, dst)
+    except (OSError, ImportError):
+        shutil.copy2(src, dst)
@@ -1,34 +1,25 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import argparse
 import os
-import re
 import sys
 import shutil
 
+from ._dotenv import load_dotenv
+from ._uring import uring_copytree
+from ._util import cached_s3_conn, normalize_prefix, reflink_or_copy
+
+_MAX_DOWNLOAD_WORKERS = 16
+
 try:
     import boto3
-    from botocore.client import Config as _BotoConfig
 except Exception:
     boto3 = None
-    _BotoConfig = None
 
 
-def _load_dotenv(path: Path = Path(__file__).parent.parent / ".env") -> None:
-    """Populate os.environ from a .env file (export VAR=... lines supported)."""
-    if not path.exists():
-        return
-    for raw in path.read_text().splitlines():
-        raw = raw.strip()
-        if not raw or raw.startswith("#"):
-            continue
-        raw = re.sub(r"^export\s+", "", raw, flags=re.I)
-        if "=" in raw:
-            k, v = raw.split("=", 1)
-            os.environ.setdefault(k.strip(), v.strip())
-
-_load_dotenv()
+load_dotenv()
 
 def _build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(
@@ -62,32 +53,45 @@ def _download_s3_prefix(
     job_uuid: str,
     dest: Path,
 ) -> None:
-    if not boto3 or not _BotoConfig:
+    if not boto3:
         sys.exit("boto3 is required for S3 downloads but is not available.")
 
-    cfg = _BotoConfig(
-        s3={"addressing_style": "path"},
-        retries={"max_attempts": 10, "mode": "standard"},
-    )
-
-    session = boto3.session.Session()
-    s3 = session.resource("s3", endpoint_url=endpoint_url, region_name=region_name, config=cfg)
+    s3, s3_cli = cached_s3_conn(endpoint_url, region_name)
     bkt = s3.Bucket(bucket)
 
-    prefix = f"{job_uuid}/"
+    prefix = normalize_prefix(job_uuid)
     found_any = False
 
-    for obj in bkt.objects.filter(Prefix=prefix):
-        # obj.key may equal "uuid/" (the folder marker) — skip those
-        if obj.key.endswith("/") or obj.key == prefix:
+    # Materialize the keys first so downloads can be parallelized. The
+    # low-level paginator yields raw key dicts instead of building an
+    # ObjectSummary per key, which matters for large listings.
+    keys: list[str] = []
+    paginator = s3_cli.get_paginator("list_objects_v2")
+    for page in paginator.paginate(
+        Bucket=bucket, Prefix=prefix, PaginationConfig={"PageSize": 1000}
+    ):
+        for item in page.get("Contents", []):
+            key = item["Key"]
+            # key may equal "uuid/" (the folder marker) — skip those
+            if key.endswith("/") or key == prefix:
+                found_any = True
+                continue
             found_any = True
-            continue
-
-        found_any = True
-        rel = obj.key[len(prefix) :]  # path inside the job folder
-        dest_path = dest / rel
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        bkt.download_file(obj.key, str(dest_path))
+            keys.append(key)
+
+    # Create all destination directories in one pass, then download each
+    # object on a thread pool (per-object RTT dominates for small files).
+    targets = {key: dest / key[len(prefix):] for key in keys}
+    for parent in {path.parent for path in targets.values()}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=_MAX_DOWNLOAD_WORKERS) as pool:
+        futures = [
+            pool.submit(bkt.download_file, key, str(path))
+            for key, path in targets.items()
+        ]
+        for fut in as_completed(futures):
+            fut.result()
 
     if not found_any:
         raise SystemExit(
@@ -99,8 +103,11 @@ def _copy_local_tree(root_dir: Path, job_uuid: str, dest: Path) -> None:
     src = root_dir / job_uuid
     if not src.exists():
         raise SystemExit(f"Local job directory not found: {src}")
+    # io_uring batches the per-file read/write syscalls where available.
+    if uring_copytree(src, dest, dirs_exist_ok=True):
+        return
     # Python 3.8+: dirs_exist_ok to merge/overwrite
-    shutil.copytree(src, dest, dirs_exist_ok=True)
+    shutil.copytree(src, dest, dirs_exist_ok=True, copy_function=reflink_or_copy)
 
 def main() -> None:
     args = _build_parser().parse_args()
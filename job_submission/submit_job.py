@@ -5,30 +5,16 @@ from pathlib import Path
 import argparse
 import shutil
 import os
+import stat
 import tempfile
 import uuid
 import sys
-import re
 import json
 import getpass
 
-def _load_dotenv(path: Path = Path(__file__).parent.parent / ".env") -> None:
-    """
-    Populate os.environ from a .env file.
-    An existing real environment variable always wins.
-    """
-    if not path.exists():
-        return
-    for raw in path.read_text().splitlines():
-        raw = raw.strip()
-        if not raw or raw.startswith("#"):
-            continue
-        raw = re.sub(r"^export\s+", "", raw, flags=re.I)
-        if "=" in raw:
-            k, v = raw.split("=", 1)
-            os.environ.setdefault(k.strip(), v.strip())
-
-_load_dotenv()
+from ._dotenv import load_dotenv
+
+load_dotenv()
 
 from .writer import get_writer
 
@@ -39,13 +25,6 @@ def _make_metadata(user: str) -> dict:
         "submitted_by": user,
     }
 
-def _write_metadata(job_dir: Path, user: str) -> None:
-    """Write user-metadata.json inside *job_dir*."""
-    (job_dir / "user-metadata.json").write_text(
-        json.dumps(_make_metadata(user), indent=2),
-        encoding="utf-8",
-    )
-
 def _build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="Submit a kernel+data job.")
     p.add_argument("--kernel", required=True, help="Path to kernel file or folder.")
@@ -68,20 +47,31 @@ def _build_parser() -> argparse.ArgumentParser:
 
     return p
 
-def _prepare_job_dir(kernel: Path, data: Path) -> Path:
-    """Copy inputs into an isolated temp dir so the writer sees one root."""
-    tmp_dir = Path(tempfile.mkdtemp(prefix="job_"))
-
-    if kernel.is_dir():
-        shutil.copytree(kernel, tmp_dir / "kernel")
-    else:
-        shutil.copy2(kernel, tmp_dir / f"kernel{kernel.suffix}")   
+def _link_or_copy(src, dst) -> None:
+    """Hard-link *src* to *dst*, falling back to a real copy.
 
-    if data.is_dir():
-        shutil.copytree(data, tmp_dir / "data")
+    Bundling is read-only staging, so a hard link is equivalent to a copy
+    but costs no data I/O; the fallback covers cross-device tempdirs.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def _stage_input(src: Path, tmp_dir: Path, name: str) -> None:
+    # One stat answers the dir-vs-file question; Path.is_dir plus .suffix
+    # would hit the filesystem and re-parse the path separately.
+    st = os.stat(src)
+    if stat.S_ISDIR(st.st_mode):
+        shutil.copytree(src, tmp_dir / name, copy_function=_link_or_copy)
     else:
-        shutil.copy2(data, tmp_dir / f"data{data.suffix}")         
+        _link_or_copy(src, tmp_dir / f"{name}{os.path.splitext(src.name)[1]}")
 
+def _prepare_job_dir(kernel: Path, data: Path) -> Path:
+    """Stage inputs into an isolated temp dir so the writer sees one root."""
+    tmp_dir = Path(tempfile.mkdtemp(prefix="job_"))
+    _stage_input(kernel, tmp_dir, "kernel")
+    _stage_input(data, tmp_dir, "data")
     return tmp_dir
 
 def main() -> None:
@@ -94,8 +84,6 @@ def main() -> None:
     # Bundle the job into a temp folder:
     job_dir = _prepare_job_dir(Path(args.kernel), Path(args.data))
 
-    _write_metadata(job_dir, args.user)
-
     if args.backend == "s3":
         writer = get_writer(
             "s3",
@@ -106,7 +94,16 @@ def main() -> None:
     else:
         writer = get_writer("local", root_dir=args.root_dir)
 
-    location = writer.write(job_dir)
+    job_id = uuid.uuid4().hex
+    location = writer.write(job_dir, key_prefix=job_id)
+
+    # Metadata is ~100 bytes of generated JSON; stream it from memory
+    # instead of writing it to the staging dir and reading it back.
+    writer.put_bytes(
+        f"{job_id}/user-metadata.json",
+        json.dumps(_make_metadata(args.user)).encode("utf-8"),
+    )
+
     print(f"Job uploaded to:  {location}")
 
 if __name__ == "__main__":
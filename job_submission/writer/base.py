@@ -21,7 +21,16 @@ class Writer(ABC):
         str
             Fully-qualified destination URI
             (e.g., 
-            'jobs/jobs/73dc9107f6f94f208e40d8e38a1cbc73' or 
+            'jobs/jobs/73dc9107f6f94f208e40d8e38a1cbc73' or
             's3://bucket/jobs/73dc9107f6f94f208e40d8e38a1cbc73'
             ).
         """
+
+    @abstractmethod
+    def put_bytes(self, key: str, data: bytes) -> None:
+        """
+        Write *data* directly to *key* on the destination.
+
+        For tiny generated files (metadata JSON) this skips the
+        write-to-disk / read-back round-trip that write() would pay.
+        """
@@ -18,3 +18,8 @@ class LocalWriter(Writer):
             raise FileExistsError(f"{dest} already exists; refusing to overwrite.")
         shutil.copytree(local_path, dest)
         return str(dest)
+
+    def put_bytes(self, key: str, data: bytes) -> None:
+        dest = self.root_dir / key
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_bytes(data)
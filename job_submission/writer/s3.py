@@ -1,12 +1,16 @@
 from __future__ import annotations
+import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-import boto3
-from botocore.client import Config as _BotoConfig
 from boto3.s3.transfer import TransferConfig
 from .base import Writer
+from .._util import cached_s3_conn
 
 class S3Writer(Writer):
+    # I/O-bound uploads: one shared client, many threads.
+    _MAX_UPLOAD_WORKERS = 16
+
     def __init__(
         self,
         bucket: str | None,
@@ -17,30 +21,45 @@ class S3Writer(Writer):
         if not bucket:
             raise ValueError("Bucket name missing (use --bucket or env var).")
 
-        cfg = _BotoConfig(
-            s3={"addressing_style": "path"},        # ← changed
-            retries={"max_attempts": 10, "mode": "standard"},
-        )
-
-        session = boto3.session.Session()
-        self._s3 = session.resource(
-            "s3",
-            endpoint_url=endpoint_url,
-            region_name=region_name,
-            config=cfg,
-        )
+        self._s3, _ = cached_s3_conn(endpoint_url, region_name)
         self._bucket = self._s3.Bucket(bucket)
         self._xfer_cfg = TransferConfig(
             multipart_threshold=multipart_threshold_mb * 1024 * 1024
         )
 
+    def _upload_one(self, fp: str, key: str) -> None:
+        # Below the multipart threshold one plain PUT beats upload_file,
+        # which spins up transfer-manager machinery per call; larger files
+        # keep the multipart path for within-object concurrency.
+        if os.stat(fp).st_size < self._xfer_cfg.multipart_threshold:
+            with open(fp, "rb") as fh:
+                self._bucket.put_object(Key=key, Body=fh)
+        else:
+            self._bucket.upload_file(fp, key, Config=self._xfer_cfg)
+
     def write(self, local_path: str | Path, key_prefix: str | None = None) -> str:
-        base = Path(local_path).resolve()
+        base = str(Path(local_path).resolve())
         job_id = key_prefix or uuid.uuid4().hex
 
-        for fp in base.rglob("*"):
-            if fp.is_file():
-                key = f"{job_id}/{fp.relative_to(base).as_posix()}"
-                self._bucket.upload_file(str(fp), key, Config=self._xfer_cfg)
+        # os.walk reads file types straight out of scandir's directory
+        # entries — no Path allocation or per-entry is_file() stat like
+        # rglob — so enumeration doesn't bottleneck the upload pool.
+        files: list[tuple[str, str]] = []  # (absolute path, object key)
+        for dirpath, _, filenames in os.walk(base):
+            rel_dir = os.path.relpath(dirpath, base).replace(os.sep, "/")
+            for name in filenames:
+                rel = name if rel_dir == "." else f"{rel_dir}/{name}"
+                files.append((os.path.join(dirpath, name), f"{job_id}/{rel}"))
+
+        # Many small files are round-trip bound; upload them in parallel over
+        # the one shared resource (boto3 clients are thread-safe).
+        with ThreadPoolExecutor(max_workers=self._MAX_UPLOAD_WORKERS) as pool:
+            futures = [pool.submit(self._upload_one, fp, key) for fp, key in files]
+            for fut in as_completed(futures):
+                fut.result()  # re-raise the first upload failure
+
+        return f"s3://{self._bucket.name}/{job_id}"
 
-        return f"s3://{self._bucket.name}/{job_id}"
\ No newline at end of file
+    def put_bytes(self, key: str, data: bytes) -> None:
+        # One HTTP PUT from memory — no file open/stat/stream like upload_file.
+        self._bucket.put_object(Key=key, Body=data)
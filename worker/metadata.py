@@ -23,8 +23,7 @@ class WorkerMetadata:
 
     def to_json(self) -> str:
         return json.dumps(
-            {"status": self.status, "claimed_at": self.claimed_at, "worker_id": self.worker_id},
-            indent=2,
+            {"status": self.status, "claimed_at": self.claimed_at, "worker_id": self.worker_id}
         )
 
 def parse_worker_metadata(text: str) -> Optional[WorkerMetadata]:
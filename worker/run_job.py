@@ -1,4 +1,5 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any
 from .metadata import WorkerMetadata
@@ -18,7 +19,7 @@ def _results_key(job_id: str) -> str:
     return f"{job_id}/{RESULTS_NAME}"
 
 def _write_local(path: Path, payload: Dict[str, Any]) -> None:
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    path.write_text(json.dumps(payload), encoding="utf-8")
 
 def run_job_once(store: JobStore, work_root: Path, job_id: str, worker_id: str) -> None:
     """
@@ -51,25 +52,38 @@ def run_job_once(store: JobStore, work_root: Path, job_id: str, worker_id: str)
             "hint": "This is simulated; replace with real error reporting later.",
         }
 
-    # --- Upload results.json to store ---
-    store.put_text(_results_key(job_id), json.dumps(results, indent=2))
-    # Mirror locally
-    _write_local(job_dir / RESULTS_NAME, results)
+    # --- Publish results + final worker-metadata ---
+    # The results upload, the metadata fetch, and the local mirror are
+    # independent round-trips, so overlap them on a small pool; only the
+    # final metadata put has to wait for the fetch.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        put_results = pool.submit(
+            store.put_text, _results_key(job_id), json.dumps(results)
+        )
+        get_meta = pool.submit(store.get_text, _worker_meta_key(job_id))
+        mirror_results = pool.submit(_write_local, job_dir / RESULTS_NAME, results)
 
-    # --- Update worker-metadata.json to final state ---
-    # Keep original claimed_at/worker_id if the file exists; otherwise write minimal.
-    try:
-        existing = store.get_text(_worker_meta_key(job_id)) or ""
-        md_obj = json.loads(existing) if existing else {}
-        md_obj["status"] = status
-        md_obj.setdefault("worker_id", worker_id)
-        md_obj.setdefault("claimed_at", WorkerMetadata.in_progress(worker_id).claimed_at)
-        md_json = json.dumps(md_obj, indent=2)
-    except Exception:
-        md_json = WorkerMetadata.in_progress(worker_id).to_json()  # fallback
-        md_obj = json.loads(md_json)
-        md_obj["status"] = status
-        md_json = json.dumps(md_obj, indent=2)
+        # Keep original claimed_at/worker_id if the file exists; otherwise write minimal.
+        try:
+            existing = get_meta.result() or ""
+            md_obj = json.loads(existing) if existing else {}
+            md_obj["status"] = status
+            md_obj.setdefault("worker_id", worker_id)
+            md_obj.setdefault("claimed_at", WorkerMetadata.in_progress(worker_id).claimed_at)
+            md_json = json.dumps(md_obj)
+        except Exception:
+            md_json = WorkerMetadata.in_progress(worker_id).to_json()  # fallback
+            md_obj = json.loads(md_json)
+            md_obj["status"] = status
+            md_json = json.dumps(md_obj)
 
-    store.put_text(_worker_meta_key(job_id), md_json)
-    (job_dir / WORKER_META_NAME).write_text(md_json, encoding="utf-8")
+        # The results upload must land before the terminal status is
+        # published — a consumer must never see 'successful'/'failure'
+        # without results.json. The upload overlapped the metadata GET
+        # above, so this join usually costs nothing.
+        put_results.result()
+
+        store.put_text(_worker_meta_key(job_id), md_json)
+        (job_dir / WORKER_META_NAME).write_text(md_json, encoding="utf-8")
+
+        mirror_results.result()
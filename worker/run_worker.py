@@ -2,28 +2,16 @@ from __future__ import annotations
 from . import get_store
 from .worker import claim_and_pull_one
 from .run_job import run_job_once
+from job_submission._dotenv import load_dotenv
 
 import argparse
 import getpass
 import os
-import re
 import socket
 import sys
 import time
 from pathlib import Path
 
-def _load_dotenv(path: Path = Path(__file__).parent.parent / ".env") -> None:
-    if not path.exists():
-        return
-    for raw in path.read_text().splitlines():
-        raw = raw.strip()
-        if not raw or raw.startswith("#"):
-            continue
-        raw = re.sub(r"^export\s+", "", raw, flags=re.I)
-        if "=" in raw:
-            k, v = raw.split("=", 1)
-            os.environ.setdefault(k.strip(), v.strip())
-
 def _build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="Worker: poll S3 (or local) for jobs, claim, run, and pull.")
     p.add_argument("--backend", choices=("s3","local"), default=os.getenv("JOB_BACKEND","s3"))
@@ -44,7 +32,7 @@ def _build_parser() -> argparse.ArgumentParser:
     return p
 
 def main() -> None:
-    _load_dotenv()
+    load_dotenv()
     args = _build_parser().parse_args()
 
     # Single worker ID grabbed from local device
@@ -82,9 +70,15 @@ def main() -> None:
         loop_once()
         return
 
+    # Re-poll immediately after a claimed job to drain bursts, and back off
+    # exponentially (capped at 60 s) while idle to cut wasted list calls.
+    backoff = 0
     while True:
-        loop_once()
-        time.sleep(args.interval)
+        if loop_once():
+            backoff = 0
+            continue
+        backoff = min(backoff * 2, 60) if backoff else args.interval
+        time.sleep(backoff)
 
 if __name__ == "__main__":
     main()
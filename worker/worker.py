@@ -14,16 +14,15 @@ def _is_claimable(store: JobStore, job_id: str) -> bool:
     True if no worker-metadata.json exists, or if it exists but is unusable.
     Not claimable if status is 'in-progress', 'successful', or 'failure'.
     """
-    key = _worker_meta_key(job_id)
-    if not store.object_exists(key):
+    # One GET covers both "missing" (get_text returns None on 404) and
+    # "unusable", where HEAD-then-GET paid two round-trips per candidate.
+    text = store.get_text(_worker_meta_key(job_id))
+    if text is None:
         return True
-    text = store.get_text(key) or ""
     md = parse_worker_metadata(text)
     if not md:
         return True
-    if md.status in ("in-progress", "successful", "failure"):
-        return False
-    return True
+    return md.status not in ("in-progress", "successful", "failure")
 
 def claim_and_pull_one(store: JobStore, work_root: Path, worker_id: str) -> Optional[str]:
     """
@@ -33,8 +32,12 @@ def claim_and_pull_one(store: JobStore, work_root: Path, worker_id: str) -> Opti
     """
     work_root.mkdir(parents=True, exist_ok=True)
 
+    # One batched listing tells us which jobs have worker-metadata at all;
+    # only those need the per-job metadata GET in _is_claimable.
+    claimed = store.list_claimed_job_ids()
+
     for job_id in store.list_job_ids():
-        if not _is_claimable(store, job_id):
+        if job_id in claimed and not _is_claimable(store, job_id):
             continue
 
         # Claim